@@ -50,6 +50,22 @@ import numpy as np
 # Want to be able to use these functions directly..
 from kval.data.dataset import metadata_to_txt, to_netcdf
 
+# Reference attributes used in quick_metadata_check()
+_GLOBAL_ATTRS_CHECK = tuple(
+    attr for attr in dict.fromkeys(_standard_attrs.global_attrs_ordered)
+    if attr not in ("date_created", "processing_level")
+)
+_VAR_ATTRS_CHECK = tuple(_standard_attrs.variable_attrs_necessary)
+_VAR_ATTRS_CHECK_CHLA = _VAR_ATTRS_CHECK + (
+    "calibration_formula",
+    "coefficient_A",
+    "coefficient_B",
+)
+_VAR_ATTRS_CHECK_PRES = tuple(
+    attr for attr in _VAR_ATTRS_CHECK
+    if attr not in ("processing_level", "QC_indicator")
+) + ("axis", "positive")
+
 # DECORATOR TO PRESERVE PROCESSING STEPS IN METADATA
 
 
@@ -62,6 +78,7 @@ def ctds_from_cnv_dir(
     verbose: bool = False,
     start_time_NMEA=False,
     processing_variable=True,
+    parallel: bool = False,
 ) -> xr.Dataset:
     """
     Create CTD datasets from CNV files in the specified path.
@@ -76,6 +93,8 @@ def ctds_from_cnv_dir(
       If True: get start_time attribute from the "NMEA UTC (Time)"
       header line. Default (False) is to grab it from the "start_time" line.
       (That seems to occasionally cause problems).
+    - parallel (bool): If True, parse the CNV files in parallel worker
+                       processes (useful for cruises with many stations).
 
     Returns:
     - ds (xarray.Dataset): Joined CTD dataset.
@@ -96,6 +115,7 @@ def ctds_from_cnv_dir(
         station_from_filename=station_from_filename,
         verbose=verbose,
         start_time_NMEA=start_time_NMEA,
+        parallel=parallel,
     )
 
     ds = tools.join_cruise(profile_datasets, verbose=verbose)
@@ -142,6 +162,7 @@ def ctds_from_cnv_list(
     verbose: bool = True,
     start_time_NMEA=False,
     processing_variable=True,
+    parallel: bool = False,
 ) -> xr.Dataset:
     """
     Create CTD datasets from CNV files in the specified list.
@@ -156,6 +177,8 @@ def ctds_from_cnv_list(
       the "NMEA UTC (Time)" header line. Default is to grab it from the
       "start_time" line.
     - processing_variable (bool): Whether to add a processing history variable.
+    - parallel (bool): If True, parse the CNV files in parallel worker
+                       processes (useful for cruises with many stations).
 
     Returns:
     - ds (xarray.Dataset): Joined CTD dataset.
@@ -165,6 +188,7 @@ def ctds_from_cnv_list(
         verbose=verbose,
         start_time_NMEA=start_time_NMEA,
         station_from_filename=station_from_filename,
+        parallel=parallel,
     )
     ds = tools.join_cruise(profile_datasets, verbose=verbose)
 
@@ -515,10 +539,16 @@ def calibrate_chl(
             chl_name_out = f"{chl_name_in}_cal"
 
     # Create a new variable with the coefficients applied
-    ds[chl_name_out] = A * ds[chl_name_in] + B
-    ds[chl_name_out].attrs = {
-        key: item for key, item in ds[chl_name_in].attrs.items()
-    }
+    # (computed in a single output buffer to avoid temporary arrays)
+    chl_in = ds[chl_name_in]
+    chl_values = chl_in.values
+    chl_cal = np.empty(chl_values.shape,
+                       dtype=np.result_type(chl_values, A, B))
+    np.multiply(chl_values, A, out=chl_cal)
+    np.add(chl_cal, B, out=chl_cal)
+
+    ds[chl_name_out] = (chl_in.dims, chl_cal)
+    ds[chl_name_out].attrs = dict(chl_in.attrs)
 
     # Add suitable attributes
     new_attrs = {
@@ -670,14 +700,17 @@ def drop_variables(
                 return ds
             retain_vars = []
 
-        all_vars = list(ds.data_vars)
-        dropped = []
-        for varnm in all_vars:
-            if varnm not in retain_vars and (
-                "PRES" in ds[varnm].dims or "NISKIN_NUMBER" in ds[varnm].dims
-            ):
-                ds = ds.drop_vars(varnm)
-                dropped.append(varnm)
+        # Collect all variables to drop first, then drop them in a single
+        # call (dropping one at a time rebuilds the dataset for every
+        # variable).
+        retain_set = set(retain_vars)
+        dropped = [
+            varnm
+            for varnm, var in ds.data_vars.items()
+            if varnm not in retain_set
+            and ("PRES" in var.dims or "NISKIN_NUMBER" in var.dims)
+        ]
+        ds = ds.drop_vars(dropped)
 
     if dropped:
         drop_str = f"Dropped these variables from the Dataset: {dropped}."
@@ -839,44 +872,35 @@ def quick_metadata_check(ds: xr.Dataset) -> None:
     print("\n# GLOBAL #")
 
     # Global attributes
-    attrs_dict_ref = _standard_attrs.global_attrs_ordered.copy()
-    attrs_dict_ref.remove("date_created")
-    attrs_dict_ref.remove("processing_level")
-
-    for attr in attrs_dict_ref:
-        if attr not in ds.attrs:
-            print(f"- Possibly missing {attr}")
+    missing_global = [
+        attr for attr in _GLOBAL_ATTRS_CHECK if attr not in ds.attrs
+    ]
+    for attr in missing_global:
+        print(f"- Possibly missing {attr}")
 
     print("\n# VARIABLE #")
 
     # Variable attributes
-    attrs_dict_ref_var = _standard_attrs.variable_attrs_necessary
-
-    for varnm in ds.variables:
-        if "PRES" in ds[varnm].dims:
-            _attrs_dict_ref_var = attrs_dict_ref_var.copy()
-
-            if varnm == "CHLA":
-                _attrs_dict_ref_var += [
-                    "calibration_formula",
-                    "coefficient_A",
-                    "coefficient_B",
-                ]
-            if varnm == "PRES":
-                _attrs_dict_ref_var += [
-                    "axis",
-                    "positive",
-                ]
-                _attrs_dict_ref_var.remove("processing_level")
-                _attrs_dict_ref_var.remove("QC_indicator")
-
-            any_missing = False
-            for var_attr in _attrs_dict_ref_var:
-                if var_attr not in ds[varnm].attrs:
-                    print(f"- {varnm}: Possibly missing {var_attr}")
-                    any_missing = True
-            if not any_missing:
-                print(f"- {varnm}: OK")
+    for varnm, var in ds.variables.items():
+        if "PRES" not in var.dims:
+            continue
+
+        if varnm == "CHLA":
+            _attrs_dict_ref_var = _VAR_ATTRS_CHECK_CHLA
+        elif varnm == "PRES":
+            _attrs_dict_ref_var = _VAR_ATTRS_CHECK_PRES
+        else:
+            _attrs_dict_ref_var = _VAR_ATTRS_CHECK
+
+        var_attrs = var.attrs
+        missing_var = [
+            var_attr for var_attr in _attrs_dict_ref_var
+            if var_attr not in var_attrs
+        ]
+        for var_attr in missing_var:
+            print(f"- {varnm}: Possibly missing {var_attr}")
+        if not missing_var:
+            print(f"- {varnm}: OK")
 
 
 ############
@@ -13,6 +13,15 @@ from kval.metadata import check_conventions, conventionalize
 from kval.util import time
 from typing import Union, List
 
+# Conditional import for zarr (optional, only needed for zarr export)
+try:
+    import zarr  # noqa: F401
+    from numcodecs import Blosc
+
+    ZARR_AVAILABLE = True
+except ImportError:
+    ZARR_AVAILABLE = False
+
 #### MODIFY METADATA
 
 def add_now_as_date_created(ds: xr.Dataset) -> xr.Dataset:
@@ -145,6 +154,65 @@ def add_processing_history_var_moored(
 
 #### HELPER FUNCTIONS
 
+def _profile_encoding(ds: xr.Dataset, file_format: str = 'netcdf') -> dict:
+    """
+    Build an encoding for numerical (TIME, PRES) profile variables.
+
+    Each variable is stored with one chunk per profile and compressed
+    (NetCDF: shuffle + zlib, Zarr: Blosc/zstd with shuffle). Any packing
+    (dtype, scale_factor, add_offset) or _FillValue already present in the
+    variable encoding is kept.
+
+    Parameters:
+    - ds: The xarray.Dataset to be exported.
+    - file_format: 'netcdf' or 'zarr'.
+
+    Returns:
+    - Dictionary of variable encodings (to pass to xr.Dataset.to_netcdf
+      or xr.Dataset.to_zarr).
+    """
+    encoding = {}
+
+    for varnm, var in ds.data_vars.items():
+        if not ('TIME' in var.dims and 'PRES' in var.dims):
+            continue
+        if not np.issubdtype(var.dtype, np.number):
+            continue
+
+        var_encoding = {
+            key: item for key, item in var.encoding.items()
+            if key in ['dtype', 'scale_factor', 'add_offset', '_FillValue']
+        }
+        chunks = tuple(
+            1 if dim == 'TIME' else ds.sizes[dim] for dim in var.dims
+        )
+
+        if file_format == 'zarr':
+            var_encoding.update({
+                'chunks': chunks,
+                'compressor': Blosc(cname='zstd', clevel=3,
+                                    shuffle=Blosc.SHUFFLE),
+            })
+        else:
+            var_encoding.update({
+                'zlib': True,
+                'complevel': 4,
+                'shuffle': True,
+                'chunksizes': chunks,
+            })
+
+        # Set the fill value explicitly for floats (unless already given).
+        # Not for variables packed to integers (NaN cannot be stored there)
+        target_dtype = np.dtype(var_encoding.get('dtype', var.dtype))
+        if (np.issubdtype(target_dtype, np.floating)
+                and '_FillValue' not in var.attrs
+                and '_FillValue' not in var_encoding):
+            var_encoding['_FillValue'] = np.nan
+
+        encoding[varnm] = var_encoding
+
+    return encoding
+
 #### EXPORT
 
 def to_netcdf(
@@ -153,19 +221,34 @@ def to_netcdf(
     file_name: str = None,
     convention_check: bool = False,
     add_to_history: bool = True,
-    verbose: bool = True
+    verbose: bool = True,
+    file_format: str = 'netcdf',
 ) -> None:
     """
-    Export xarray Dataset to NetCDF format.
+    Export xarray Dataset to NetCDF (or Zarr) format.
 
     Parameters:
     - ds: The xarray.Dataset to export.
     - path: Directory where the file will be saved.
     - file_name: Name of the NetCDF file.
-    - convention_check: If True, check file conventions.
+    - convention_check: If True, check file conventions (NetCDF only).
     - add_to_history: If True, update the history attribute.
     - verbose: If True, print information about the export process.
+    - file_format: 'netcdf' (default) or 'zarr'. Zarr export requires the
+      optional `zarr` package and writes a .zarr store (asks before
+      overwriting an existing store).
     """
+    if file_format not in ['netcdf', 'zarr']:
+        raise ValueError(
+            f'Invalid file_format "{file_format}" (must be "netcdf" or "zarr").'
+        )
+    if file_format == 'zarr' and not ZARR_AVAILABLE:
+        raise ImportError(
+            "zarr (version 2) is not installed. Please install it to export "
+            "to Zarr, e.g.:\n$ pip install \"kval[zarr]\"\n"
+            "or:\n$ pip install \"zarr<3\""
+        )
+
     path = Path(path)
 
     ds = add_now_as_date_created(ds)
@@ -174,37 +257,64 @@ def to_netcdf(
     if file_name is None:
         file_name = getattr(ds, 'id', 'DATASET_NO_NAME')
 
-    if not file_name.endswith('.nc'):
-        file_name += '.nc'
+    extension = '.zarr' if file_format == 'zarr' else '.nc'
+    if not file_name.endswith(extension):
+        file_name += extension
 
     file_path = path / file_name
 
     if add_to_history:
-        if 'history' not in ds.attrs:
-            ds.attrs['history'] = ''
-
-        if 'Creation of this netcdf file' in ds.attrs['history']:
-            history_lines = ds.attrs['history'].split('\n')
-            updated_history = [
-                line for line in history_lines if "Creation of this netcdf file" not in line
-            ]
-            ds.attrs['history'] = '\n'.join(updated_history)
+        history = ds.attrs.get('history', '')
+
+        creation_strs = ['Creation of this netcdf file',
+                         'Creation of this zarr store']
+        if any(cstr in history for cstr in creation_strs):
+            history = '\n'.join(
+                line for line in history.split('\n')
+                if not any(cstr in line for cstr in creation_strs)
+            )
 
         now_time = pd.Timestamp.now().strftime('%Y-%m-%d')
-        ds.attrs['history'] += f'\n{now_time}: Creation of this netcdf file.'
+        creation_str = (creation_strs[1] if file_format == 'zarr'
+                        else creation_strs[0])
+        ds.attrs['history'] = ''.join(
+            (history, '\n', now_time, ': ', creation_str, '.'))
 
         if verbose:
             print(f'Updated history attribute. Current content:\n---')
             print(ds.attrs['history'])
             print('---')
 
+    # One chunk per profile, compressed (preset so that each variable is
+    # written in a single block)
+    encoding = _profile_encoding(ds, file_format=file_format)
+
+    if file_format == 'zarr':
+        if file_path.exists():
+            user_input = input(f"The store {file_path} already exists. Overwrite? (y/n): ")
+            if user_input.lower() not in ['yes', 'y']:
+                print("Operation canceled. Store not overwritten.")
+                return
+            ds.to_zarr(file_path, mode='w', encoding=encoding)
+            print(f"Store {file_path} overwritten.")
+        else:
+            ds.to_zarr(file_path, mode='w', encoding=encoding)
+
+        if verbose:
+            print(f'Exported Zarr store as: {file_path}')
+        if convention_check:
+            print('NOTE: The convention checker only works on NetCDF files.')
+        return
+
     try:
-        ds.to_netcdf(file_path)
+        ds.to_netcdf(file_path, encoding=encoding,
+                     engine='netcdf4', format='NETCDF4')
     except PermissionError:
         user_input = input(f"The file {file_path} already exists. Overwrite? (y/n): ")
         if user_input.lower() in ['yes', 'y']:
             os.remove(file_path)
-            ds.to_netcdf(file_path)
+            ds.to_netcdf(file_path, encoding=encoding,
+                         engine='netcdf4', format='NETCDF4')
             print(f"File {file_path} overwritten.")
         else:
             print("Operation canceled. File not overwritten.")
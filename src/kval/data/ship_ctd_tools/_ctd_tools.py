@@ -21,7 +21,11 @@ import glob2
 import re
 import pandas as pd
 import cftime
+import os
+import functools
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 def join_cruise(nc_files, bins_dbar = 1, verbose = True,
                 epoch = '1970-01-01'):
@@ -574,10 +578,15 @@ def _add_standard_variable_attributes(ds):
 def _cnv_files_from_path(path):
     '''
     Get a list of .cnv files from a path.
+
+    The extension is matched case-insensitively (.cnv, .CNV). Hidden files
+    and directories are ignored.
     '''
-    if not path.endswith('/'):
-        path += '/'
-    cnv_list = glob2.glob(f'{path}*.cnv')
+    with os.scandir(path) as entries:
+        cnv_list = [entry.path for entry in entries
+                    if entry.name.lower().endswith('.cnv')
+                    and not entry.name.startswith('.')
+                    and entry.is_file()]
     return cnv_list
 
 def _btl_files_from_path(path):
@@ -590,26 +599,72 @@ def _btl_files_from_path(path):
 
 def _datasets_from_cnvlist(cnv_list,
                            station_from_filename = False,
-                           verbose = True, start_time_NMEA = False):
+                           verbose = True, start_time_NMEA = False,
+                           parallel = False):
     '''
     Get a list of profile xr.Datasets from a list of .cnv files.
+
+    If parallel is True (and there are more than a few files), the files
+    are parsed in a pool of worker processes (parsing is CPU-bound, so
+    threads would be limited by the GIL). Falls back to reading the files
+    one by one if the process pool fails. The order of the returned datasets
+    follows cnv_list either way.
     '''
-    dataset_list = []
-    for fn in cnv_list:
+    read_cnv = functools.partial(
+        _dataset_from_cnv,
+        station_from_filename = station_from_filename,
+        verbose = verbose,
+        start_time_NMEA = start_time_NMEA)
+
+    dataset_list = None
+
+    if parallel and len(cnv_list) > 4:
+        # Never more workers than files (or than the maximum of 61
+        # workers allowed by ProcessPoolExecutor on Windows)
+        n_workers = min(len(cnv_list), os.cpu_count() or 1, 61)
+        chunksize = max(1, len(cnv_list) // (4 * n_workers))
         try:
-            dataset_list += [sbe.read_cnv(fn, time_dim=True,
-                            station_from_filename = station_from_filename,
-                            suppress_time_warning=not verbose,
-                            suppress_latlon_warning=not verbose,
-                            start_time_NMEA = start_time_NMEA)]
-        except:
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                dataset_list = list(executor.map(read_cnv, cnv_list,
+                                                 chunksize=chunksize))
+        except BrokenProcessPool:
+            print('NOTE: Parallel reading of .cnv files failed '
+                  '-> reading files one by one instead.')
+
+    if dataset_list is None:
+        dataset_list = [read_cnv(fn) for fn in cnv_list]
+
+    # Files that could not be read are returned as None. (Printing the note
+    # here rather than in the worker processes, where output may not reach
+    # the notebook).
+    for fn, ds in zip(cnv_list, dataset_list):
+        if ds is None:
             print(f'\n*NOTE*: Could not read file {fn}.')
             print('(This usually indicates some sort of problem with the file.'
                   ' For example, sensor setup may not match variables.) '
                   '\n-> LOOK AT THE .CNV FILE! (skipping this file for now)\n')
+    dataset_list = [ds for ds in dataset_list if ds is not None]
+
     return dataset_list
 
 
+def _dataset_from_cnv(fn, station_from_filename = False,
+                      verbose = True, start_time_NMEA = False):
+    '''
+    Read a single .cnv file to a profile xr.Dataset.
+
+    Returns None if the file could not be read.
+    '''
+    try:
+        return sbe.read_cnv(fn, time_dim=True,
+                            station_from_filename = station_from_filename,
+                            suppress_time_warning=not verbose,
+                            suppress_latlon_warning=not verbose,
+                            start_time_NMEA = start_time_NMEA)
+    except:
+        return None
+
+
 def _datasets_from_btllist(btl_list,
                            station_from_filename = False,
                            verbose = True, start_time_NMEA = False,
@@ -15,6 +15,7 @@ from kval.data.ship_ctd_tools import _ctd_tools
 from kval.maps import quickmap
 from matplotlib.ticker import MaxNLocator
 from matplotlib.colors import Colormap
+from matplotlib.collections import LineCollection
 import cmocean
 import numpy as np
 from kval.util import internals
@@ -49,73 +50,110 @@ def inspect_profiles(ds: 'xr.Dataset') -> None:
     # Determine if this is a single profile
     is_single_profile = ds.sizes['TIME'] == 1
 
-    def plot_profile(TIME_index: int, variable: str, y_varnm: str, y_label: str,
-                     is_single_profile: bool = False) -> None:
+    profile_vars = _ctd_tools._get_profile_variables(
+        ds, profile_var=y_varnm, require_TIME=not is_single_profile)
+
+    # Extract data and coordinates as numpy arrays once, rather than
+    # going through xarray on every widget update
+    if is_single_profile:
+        profile_arrays = {varnm: ds[varnm].values for varnm in profile_vars}
+    else:
+        profile_arrays = {varnm: ds[varnm].transpose('TIME', y_varnm).values
+                          for varnm in profile_vars}
+    var_units = {varnm: ds[varnm].attrs.get('units', 'no unit specified')
+                 for varnm in profile_vars}
+    y_values = ds[y_varnm].values
+    station_values = ds['STATION'].values if 'STATION' in ds else None
+    time_nums = np.atleast_1d(ds.TIME.values)
+    time_units = ds.TIME.units
+    time_strings = {}  # Filled lazily: TIME_index -> date string for titles
+
+    # Choose marker size based on the number of points
+    Nz = len(y_values)
+    ms = 2 if Nz > 100 else 2 + (100 - Nz) * 0.05
+
+    # Build the figure once (inside an output widget). Widget interactions
+    # only update the data of the existing artists (see update_profile()).
+    output = widgets.Output()
+    with output:
+        fig, ax = plt.subplots()
+
+        # All profiles in the background (as a single LineCollection
+        # rather than one line per profile)
+        background = LineCollection([], color='tab:blue', lw=0.5, alpha=0.4)
+        if not is_single_profile:
+            ax.add_collection(background)
+
+        # The selected profile
+        line_main, = ax.plot(np.full(Nz, np.nan), y_values, alpha=0.8,
+                             lw=0.7, color='k')
+        line_dots, = ax.plot(np.full(Nz, np.nan), y_values, '.', ms=ms,
+                             alpha=1, color='tab:orange')
+
+        # Fixed (inverted) y-axis covering all pressure levels
+        y_min, y_max = np.nanmin(y_values), np.nanmax(y_values)
+        y_pad = 0.05 * (y_max - y_min) if y_max > y_min else 0.5
+        ax.set_ylim(y_max + y_pad, y_min - y_pad)
+        ax.set_ylabel(y_label)
+        ax.grid()
+        fig.canvas.header_visible = False  # Hide the figure header
+
+    def update_profile(TIME_index: int, variable: str) -> None:
         """
-        Plot a single profile with the option to view others in the background.
+        Show a single profile with the others in the background.
 
         Parameters:
         - TIME_index: int
             Index of the selected profile.
         - variable: str
             Name of the variable to plot.
-        - y_varnm: str
-            Vertical axis variable name.
-        - y_label: str
-            Label for the vertical axis.
         """
-        try:
-            previous_fig = plt.gcf()
-            plt.close(previous_fig)
-        except Exception:
-            pass
-
-        fig, ax = plt.subplots()
+        var_array = profile_arrays[variable]
 
-        # Plot all profiles in black in the background
         if not is_single_profile:
-            for nn in np.arange(ds.sizes['TIME']):
-                if nn != TIME_index:  # Skip the selected profile
-                    profile = ds[variable].isel(TIME=nn, drop=True).squeeze()
-                    ax.plot(profile, ds[y_varnm], color='tab:blue', lw=0.5, alpha=0.4)
-
-        # Choose marker size based on the number of points
-        Nz = len(ds[y_varnm])
-        ms = 2 if Nz > 100 else 2 + (100 - Nz) * 0.05
-
-        # Plot the selected profile
-        if not is_single_profile:
-            profile = ds[variable].isel(TIME=TIME_index)
+            y_array = np.broadcast_to(y_values, var_array.shape)
+            segments = np.stack([var_array, y_array], axis=-1)
+            segments = np.delete(segments, TIME_index, axis=0)  # Skip selected
+            background.set_segments(segments)
+            profile = var_array[TIME_index]
         else:
-            profile = ds[variable]
-        ax.plot(profile, ds[y_varnm], alpha=0.8, lw=0.7, color='k')
-        ax.plot(profile, ds[y_varnm], '.', ms=ms, alpha=1, color='tab:orange')
-
-        if not is_single_profile:
-            time_string = time.convert_timenum_to_datestring(
-                profile.TIME, ds.TIME.units)
-            station = (ds["STATION"].values[TIME_index]
-                       if 'STATION' in ds else 'N/A')
+            profile = var_array
+
+        line_main.set_xdata(profile)
+        line_dots.set_xdata(profile)
+
+        # Fit the x-axis to all profiles of this variable
+        if np.isfinite(var_array).any():
+            x_min, x_max = np.nanmin(var_array), np.nanmax(var_array)
+            x_pad = 0.05 * (x_max - x_min) if x_max > x_min else 0.5
+            ax.set_xlim(x_min - x_pad, x_max + x_pad)
+
+        if TIME_index not in time_strings:
+            time_strings[TIME_index] = time.convert_timenum_to_datestring(
+                time_nums[TIME_index], time_units)
+        time_string = time_strings[TIME_index]
+
+        if station_values is None:
+            station = 'N/A'
+        elif not is_single_profile:
+            station = station_values[TIME_index]
         else:
-            time_string = time.convert_timenum_to_datestring(ds.TIME.item(),
-                                                             ds.TIME.units)
-            station = ds["STATION"].values.item() if 'STATION' in ds else 'N/A'
+            station = station_values.item()
 
         ax.set_title(f'Station: {station}, {time_string}')
-        var_unit = (ds[variable].units if 'units' in ds[variable].attrs
-                    else 'no unit specified')
-        ax.set_xlabel(f'{variable} [{var_unit}]')
-        ax.set_ylabel(y_label)
-        ax.invert_yaxis()
-        ax.grid()
-        fig.canvas.header_visible = False  # Hide the figure header
+        ax.set_xlabel(f'{variable} [{var_units[variable]}]')
+        fig.canvas.draw_idle()
+
+    # Draw the first profile before showing the figure
+    update_profile(0, profile_vars[0])
+    with output:
         plt.tight_layout()
         plt.show()
 
     # Create interactive widgets
     time_values = list(range(ds.sizes['TIME']))
-    time_descriptions = [f'{nn} ({ds["STATION"].values[nn]})' for nn in time_values] \
-                        if 'STATION' in ds else time_values
+    time_descriptions = [f'{nn} ({station_values[nn]})' for nn in time_values] \
+                        if station_values is not None else time_values
 
     time_index_slider = widgets.IntSlider(
         min=0, max=len(ds['TIME']) - 1, step=1, value=0,
@@ -124,10 +162,6 @@ def inspect_profiles(ds: 'xr.Dataset') -> None:
         layout=widgets.Layout(width='500px')
     )
 
-
-    profile_vars = _ctd_tools._get_profile_variables(
-        ds, profile_var=y_varnm, require_TIME=not is_single_profile)
-
     variable_dropdown = widgets.Dropdown(
         options=profile_vars,
         value=profile_vars[0],
@@ -150,20 +184,15 @@ def inspect_profiles(ds: 'xr.Dataset') -> None:
     time_ind_dropdown.observe(update_slider_from_dropdown, names='value')
     time_index_slider.observe(update_dropdown_from_slider, names='value')
 
-    output = widgets.interactive_output(
-        plot_profile, {
-            'TIME_index': time_index_slider,
-            'variable': variable_dropdown,
-            'y_varnm': widgets.fixed(y_varnm),
-            'y_label': widgets.fixed(y_label),
-            'is_single_profile': widgets.fixed(is_single_profile)
-        }
-    )
+    def on_widget_change(_) -> None:
+        update_profile(time_index_slider.value, variable_dropdown.value)
+
+    time_index_slider.observe(on_widget_change, names='value')
+    variable_dropdown.observe(on_widget_change, names='value')
 
     close_button = widgets.Button(description="Close")
 
     def close_plot(_) -> None:
-        fig = plt.gcf()
         fig.set_size_inches(0, 0)
         widgets_collected.close()
         plt.close(fig)
@@ -345,10 +374,15 @@ def map(
     # Making sure we are in an interactive notebook environment
     internals.check_interactive()
 
-    lat_span = float(ds.LATITUDE.max() - ds.LATITUDE.min())
-    lon_span = float(ds.LONGITUDE.max() - ds.LONGITUDE.min())
-    lat_ctr = float(0.5 * (ds.LATITUDE.max() + ds.LATITUDE.min()))
-    lon_ctr = float(0.5 * (ds.LONGITUDE.max() + ds.LONGITUDE.min()))
+    lat = ds.LATITUDE.values
+    lon = ds.LONGITUDE.values
+    lat_min, lat_max = float(np.nanmin(lat)), float(np.nanmax(lat))
+    lon_min, lon_max = float(np.nanmin(lon)), float(np.nanmax(lon))
+
+    lat_span = lat_max - lat_min
+    lon_span = lon_max - lon_min
+    lat_ctr = 0.5 * (lat_max + lat_min)
+    lon_ctr = 0.5 * (lon_max + lon_min)
 
     fig, ax = quickmap.quick_map_stere(
         lon_ctr, lat_ctr, height=height, width=width, coast_resolution=coast_resolution
@@ -356,8 +390,8 @@ def map(
 
     fig.canvas.header_visible = False  # Hide the figure header
 
-    ax.plot(ds.LONGITUDE, ds.LATITUDE, '-k', transform=ccrs.PlateCarree(), alpha=0.5)
-    ax.plot(ds.LONGITUDE, ds.LATITUDE, 'or', transform=ccrs.PlateCarree())
+    ax.plot(lon, lat, '-k', transform=ccrs.PlateCarree(), alpha=0.5)
+    ax.plot(lon, lat, 'or', transform=ccrs.PlateCarree())
 
     # Add labels next to each point if required
     if station_labels:
@@ -371,7 +405,7 @@ def map(
         elif station_labels == 'below':
             xytext, ha, va = (0, -5), 'center', 'top'
 
-        for label, x, y in zip(ds.STATION.values, ds.LONGITUDE, ds.LATITUDE):
+        for label, x, y in zip(ds.STATION.values, lon, lat):
             plt.annotate(
                 label, (x, y), textcoords="offset points", xytext=xytext, ha=ha, va=va,
                 transform=ccrs.PlateCarree(), alpha=station_label_alpha, fontsize=8
@@ -461,8 +495,33 @@ def ctd_contours(ds):
     else:
         y_label = f'{y_varnm}'
 
-    # Function to update plots based on variable, xvar, and max depth selection
-    def update_plots(variable1, variable2, xvar, max_depth):
+    # Get the list of available variables
+    available_variables = _ctd_tools._get_profile_variables(
+        ds, profile_var = y_varnm)
+
+    # Extract data and coordinates as numpy arrays once, rather than
+    # going through xarray on every widget update. The data are stored as
+    # contiguous (y_varnm, TIME) arrays, ready for contouring.
+    profile_arrays_T = {
+        varnm: np.ascontiguousarray(
+            ds[varnm].transpose(y_varnm, 'TIME').values)
+        for varnm in available_variables}
+    var_units = {varnm: ds[varnm].attrs.get('units', 'no unit specified')
+                 for varnm in available_variables}
+    y_values = ds[y_varnm].values
+    lonlat_values = {xvar: ds[xvar].values for xvar in
+                     ['LONGITUDE', 'LATITUDE'] if xvar in ds}
+    profile_numbers = np.arange(ds.sizes['TIME'])
+    x_ticks = np.zeros(ds.sizes['TIME'])
+
+    # Timestamps are only computed (once) if TIME is selected as x axis
+    time_stamps = {}
+
+    # The current figure and axes (used when only the max depth changes)
+    current_plot = {}
+
+    # Function to update plots based on variable and xvar selection
+    def update_plots(variable1, variable2, xvar):
 
         try:
             previous_fig = plt.gcf()
@@ -473,53 +532,47 @@ def ctd_contours(ds):
         fig, ax = plt.subplots(2, 1, sharex=True, sharey=True)
         fig.canvas.header_visible = False  # Hide the figure header
 
+        sort_index = None
+        if xvar == 'TIME':
+            if 'TIME' not in time_stamps:
+                time_stamps['TIME'] = time.datenum_to_timestamp(
+                    ds.TIME, ds.TIME.units)
+            x_data = time_stamps['TIME']
+            x_label = 'Time'
+        elif xvar in ['LONGITUDE', 'LATITUDE']:
+            # Sort profiles by longitude/latitude
+            sort_index = np.argsort(lonlat_values[xvar], kind='stable')
+            x_data = lonlat_values[xvar][sort_index]
+            x_label = xvar.capitalize()
+        elif xvar == 'Profile #':
+            x_data = profile_numbers
+            x_label = 'Profile #'
+        else:
+            raise ValueError(f"Invalid value for xvar: {xvar}")
+
         for axn, varnm in zip(ax, [variable1, variable2]):
             colormap = _cmap_picker(varnm)
-            plt.xticks(rotation=0)
+            plt.xticks(rotation=90 if xvar == 'TIME' else 0)
 
-            if xvar == 'TIME':
-                x_data = result_timestamp = time.datenum_to_timestamp(
-                    ds.TIME, ds.TIME.units)
-                plt.xticks(rotation=90)
-                x_label = 'Time'
-            elif xvar == 'LONGITUDE':
-                x_data = ds[xvar]
-                x_label = 'Longitude'
-            elif xvar == 'LATITUDE':
-                x_data = ds[xvar]
-                x_label = 'Latitude'
-            elif xvar == 'Profile #':
-                x_data = np.arange(ds.sizes['TIME'])
-                x_label = 'Profile #'
-            else:
-                raise ValueError(f"Invalid value for xvar: {xvar}")
-
-            if xvar in ['TIME', 'Profile #']:
-                ds_sorted = ds
-            else:
-                ds_sorted = ds.sortby(xvar)
-                x_data = ds_sorted[xvar]
-
-            C = axn.contourf(x_data, ds_sorted[y_varnm], ds_sorted[varnm].T,
-                             cmap=colormap, levels = 30)
+            var_array_T = profile_arrays_T[varnm]
+            if sort_index is not None:
+                var_array_T = var_array_T[:, sort_index]
 
-            if 'units' in ds_sorted[varnm].attrs:
-                var_unit_ = ds_sorted[varnm].units
-            else:
-                var_unit_ = 'no unit specified'
+            C = axn.contourf(x_data, y_values, var_array_T,
+                             cmap=colormap, levels = 30)
 
-            cb = plt.colorbar(C, ax=axn, label=var_unit_)
+            cb = plt.colorbar(C, ax=axn, label=var_units[varnm])
 
             # Set colorbar ticks using MaxNLocator
             cb.locator = MaxNLocator(nbins=6)  # Adjust the number of ticks as needed
             cb.update_ticks()
 
-            axn.plot(x_data, np.zeros(ds_sorted.sizes['TIME']), '|k',
+            axn.plot(x_data, x_ticks, '|k',
                      clip_on = False, zorder = 0)
 
             axn.set_title(varnm)
 
-            conts = axn.contour(x_data, ds_sorted[y_varnm], ds_sorted[varnm].T,
+            conts = axn.contour(x_data, y_values, var_array_T,
                         colors = 'k', linewidths = 0.8, alpha = 0.2,
                         levels = cb.get_ticks()[::2])
 
@@ -527,14 +580,18 @@ def ctd_contours(ds):
             axn.set_ylabel(y_label)
 
         ax[1].set_xlabel(x_label)
-        ax[0].set_ylim(max_depth, 0)
+        ax[0].set_ylim(max_depth_slider.value, 0)
         plt.tight_layout()
 
+        current_plot['fig'], current_plot['ax'] = fig, ax
+
         plt.show()
 
-    # Get the list of available variables
-    available_variables = _ctd_tools._get_profile_variables(
-        ds, profile_var = y_varnm)
+    # Changing the max depth only changes the y limits (no new contouring)
+    def update_max_depth(change):
+        if 'ax' in current_plot:
+            current_plot['ax'][0].set_ylim(change.new, 0)
+            current_plot['fig'].canvas.draw_idle()
 
     # Create dropdowns for variable selection
     variable_dropdown1 = widgets.Dropdown(options=available_variables,
@@ -560,41 +617,49 @@ def ctd_contours(ds):
 
     # Create slider for max depth selection
     max_depth_slider = widgets.IntSlider(min=1, max=ds[y_varnm][-1].values, step=1,
-                                         value=ds[y_varnm][-1].values, description='Max depth [m]:')
+                                         value=ds[y_varnm][-1].values, description='Max depth [m]:',
+                                         continuous_update=False)
+    max_depth_slider.observe(update_max_depth, names='value')
 
-    # Use interactive to update plots based on variable, xvar, and max depth selection
+    # Use interactive to update plots based on variable and xvar selection
     out = widgets.interactive_output(update_plots,
                                      {'variable1': variable_dropdown1,
                                       'variable2': variable_dropdown2,
-                                      'xvar': xvar_dropdown,
-                                      'max_depth': max_depth_slider})
+                                      'xvar': xvar_dropdown})
 
     widgets_collected = widgets.VBox([widgets.HBox([variable_dropdown1, variable_dropdown2]),
                           widgets.HBox([xvar_dropdown, close_button,]),  max_depth_slider, out])
     display(widgets_collected)
 
 
+# Colormaps for different variables: (substring of variable name, cmocean
+# colormap name). The first matching rule is used.
+_CMAP_RULES = (
+    ('TEMP', 'thermal'),
+    ('PSAL', 'haline'),
+    ('CHLA', 'algae'),
+    ('SIGTH', 'deep'),
+    ('CDOM', 'turbid'),
+    ('DOXY', 'tempo'),
+    ('ATTN', 'matter'),
+    ('SVEL', 'speed'),
+)
+_CMAP_DEFAULT = 'amp'
+
+# Colormaps already picked for a given variable name
+_CMAP_CACHE = {}
+
+
 def _cmap_picker(varnm: str) -> Colormap:
     '''
     Choose the appropriate colormap for different variables.
     '''
-    cmap_name = 'amp'
-    if 'TEMP' in varnm:
-        cmap_name = 'thermal'
-    elif 'PSAL' in varnm:
-        cmap_name = 'haline'
-    elif 'CHLA' in varnm:
-        cmap_name = 'algae'
-    elif 'SIGTH' in varnm:
-        cmap_name = 'deep'
-    elif 'CDOM' in varnm:
-        cmap_name = 'turbid'
-    elif 'DOXY' in varnm:
-        cmap_name = 'tempo'
-    elif 'ATTN' in varnm:
-        cmap_name = 'matter'
-    elif 'SVEL' in varnm:
-        cmap_name = 'speed'
-    cmap = getattr(cmocean.cm, cmap_name)
-
-    return cmap
\ No newline at end of file
+    cmap = _CMAP_CACHE.get(varnm)
+
+    if cmap is None:
+        cmap_name = next((name for key, name in _CMAP_RULES if key in varnm),
+                         _CMAP_DEFAULT)
+        cmap = getattr(cmocean.cm, cmap_name)
+        _CMAP_CACHE[varnm] = cmap
+
+    return cmap
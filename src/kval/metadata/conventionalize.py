@@ -8,12 +8,14 @@ from kval.metadata import _standard_attrs, _standard_attrs_org
 from kval.calc import number
 from kval.util import time, user_input
 import numpy as np
-import re
 from collections import Counter
 import pandas as pd
 import xarray as xr
 from typing import Optional
 
+# Translation table deleting digits (used to strip numbers from variable names)
+_DIGIT_STRIP = str.maketrans("", "", "0123456789")
+
 
 def add_range_attrs(D, vertical_var=None):
     """
@@ -130,19 +132,25 @@ def reorder_attrs(D):
         D.attrs, _standard_attrs.global_attrs_ordered
     )
     attrs_dict = D.attrs
-    D.attrs = {}
-    for attr_name in reordered_list:
-        D.attrs[attr_name] = attrs_dict[attr_name]
+    # Only reassign if the attributes are not already in order
+    if list(attrs_dict) != reordered_list:
+        D.attrs = {
+            attr_name: attrs_dict[attr_name] for attr_name in reordered_list
+        }
 
     # VARIABLE
-    for varnm in D.data_vars:
+    for varnm, var in D.data_vars.items():
+        var_attrs_dict = var.attrs
         reordered_list_var = _reorder_list(
-            D[varnm].attrs, _standard_attrs.variable_attrs_ordered
+            var_attrs_dict, _standard_attrs.variable_attrs_ordered
         )
-        var_attrs_dict = D[varnm].attrs
-        D[varnm].attrs = {}
-        for attr_name in reordered_list_var:
-            D[varnm].attrs[attr_name] = var_attrs_dict[attr_name]
+        # Skip variables where the attributes are already in order
+        if list(var_attrs_dict) == reordered_list_var:
+            continue
+        D[varnm].attrs = {
+            attr_name: var_attrs_dict[attr_name]
+            for attr_name in reordered_list_var
+        }
     return D
 
 
@@ -156,17 +164,19 @@ def remove_numbers_in_var_names(D):
     all_varnms = [varnm for varnm in D.data_vars]
 
     # Get number-stripped names
-    varnms_stripped = [re.sub(r"\d", "", varnm) for varnm in all_varnms]
+    varnms_stripped = [varnm.translate(_DIGIT_STRIP) for varnm in all_varnms]
 
     # Identify duplicates
     counter = Counter(varnms_stripped)
-    duplicates = [item for item, count in counter.items() if count > 1]
+    duplicates = {item for item, count in counter.items() if count > 1}
 
-    # Strip names
-    for varnm in all_varnms:
-        if re.sub(r"\d", "", varnm) not in duplicates:
-            varnm_stripped = re.sub(r"\d", "", varnm)
-            D = D.rename_vars({varnm: varnm_stripped})
+    # Strip names (renaming all variables in one go)
+    rename_dict = {
+        varnm: varnm_stripped
+        for varnm, varnm_stripped in zip(all_varnms, varnms_stripped)
+        if varnm != varnm_stripped and varnm_stripped not in duplicates
+    }
+    D = D.rename_vars(rename_dict)
 
     return D
 
@@ -179,13 +189,16 @@ def _reorder_list(input_list, ordered_list):
     existing_attributes = set(input_list)
 
     # Extract ordered attributes that exist in the dataset
+    # (dict.fromkeys: ordered_list may contain duplicates)
     ordered_attributes = [
-        attr for attr in ordered_list if attr in existing_attributes
+        attr for attr in dict.fromkeys(ordered_list)
+        if attr in existing_attributes
     ]
 
     # Add any remaining attributes that are not in the ordered list
+    ordered_set = set(ordered_attributes)
     remaining_attributes = [
-        attr for attr in input_list if attr not in ordered_attributes
+        attr for attr in input_list if attr not in ordered_set
     ]
 
     # Concatenate the ordered and remaining attributes
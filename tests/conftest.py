@@ -0,0 +1,13 @@
+"""
+Shared pytest configuration for the kval tests.
+
+Heavy dependencies are imported once here (before collection), so that the
+import cost is not attributed to (or repeated in) the first test module
+that happens to use them.
+"""
+
+import numpy  # noqa: F401
+import pandas  # noqa: F401
+import xarray  # noqa: F401
+
+from kval.util import xr_funcs  # noqa: F401
@@ -0,0 +1,69 @@
+import os
+import pytest
+import glob2
+from kval.data.ship_ctd_tools import _ctd_tools
+
+
+@pytest.fixture
+def cnv_list_with_unreadable(tmp_path):
+    '''
+    Returns a list of the sbe911plus test .cnv files, with one unreadable
+    .cnv file inserted in the middle.
+    '''
+    test_data_dir = 'tests/test_data/sbe_files/sbe911plus/'
+    cnv_list = sorted(glob2.glob(f'{test_data_dir}*/*.cnv'))
+
+    bad_cnv = tmp_path / 'unreadable.cnv'
+    bad_cnv.write_text('This is not a .cnv file\n')
+
+    n_half = len(cnv_list) // 2
+    return cnv_list[:n_half] + [str(bad_cnv)] + cnv_list[n_half:]
+
+
+def test_datasets_from_cnvlist_parallel_matches_serial(
+        cnv_list_with_unreadable, capsys):
+    cnv_list = cnv_list_with_unreadable
+    # Make sure we actually exercise the process pool (used for >4 files)
+    assert len(cnv_list) > 4
+
+    datasets_serial = _ctd_tools._datasets_from_cnvlist(
+        cnv_list, verbose=False, parallel=False)
+    assert 'Could not read file' in capsys.readouterr().out
+
+    datasets_parallel = _ctd_tools._datasets_from_cnvlist(
+        cnv_list, verbose=False, parallel=True)
+    out = capsys.readouterr().out
+
+    # The process pool should not have fallen back to serial reading, and
+    # the note about the unreadable file should be printed by this process
+    assert 'Parallel reading' not in out
+    assert 'Could not read file' in out and 'unreadable.cnv' in out
+
+    # The unreadable file is skipped (in both cases)
+    assert len(datasets_serial) == len(cnv_list) - 1
+    assert len(datasets_parallel) == len(datasets_serial)
+
+    # Same datasets, in the same order
+    for ds_serial, ds_parallel in zip(datasets_serial, datasets_parallel):
+        assert ds_serial.identical(ds_parallel)
+    # ..and in the order of the input list
+    readable_files = [fn for fn in cnv_list
+                      if not fn.endswith('unreadable.cnv')]
+    for fn, ds_parallel in zip(readable_files, datasets_parallel):
+        ds_single = _ctd_tools._dataset_from_cnv(fn, verbose=False)
+        assert ds_single.identical(ds_parallel)
+
+
+def test_cnv_files_from_path(tmp_path):
+    # Regular files (lower- and upper-case extension)
+    (tmp_path / 'sta001.cnv').write_text('')
+    (tmp_path / 'STA002.CNV').write_text('')
+    # Should be ignored: hidden file, directory, other extension
+    (tmp_path / '.sta003.cnv').write_text('')
+    (tmp_path / 'sta004.cnv').mkdir()
+    (tmp_path / 'sta005.btl').write_text('')
+
+    for path in [str(tmp_path), f'{tmp_path}/', tmp_path]:
+        cnv_files = _ctd_tools._cnv_files_from_path(path)
+        assert sorted(os.path.basename(fn) for fn in cnv_files) == [
+            'STA002.CNV', 'sta001.cnv']
@@ -131,6 +131,107 @@ def test_to_netcdf_convention_check(mock_dataset):
             mock_check.assert_called_once_with(Path(tmpdir) / 'test_dataset.nc')
 
 
+def test_to_netcdf_encoding(mock_dataset):
+    """
+    Test the to_netcdf function to ensure (TIME, PRES) variables are written
+    compressed, with one chunk per profile.
+    """
+    with TemporaryDirectory() as tmpdir:
+        dataset.to_netcdf(mock_dataset, tmpdir, file_name='encoding_test',
+                          verbose=False)
+
+        with xr.open_dataset(Path(tmpdir) / 'encoding_test.nc') as ds_nc:
+            encoding = ds_nc['TEMP'].encoding
+            assert encoding['chunksizes'] == (1, mock_dataset.sizes['PRES'])
+            assert encoding['zlib']
+            assert encoding['shuffle']
+
+
+def test_to_netcdf_packed_int(mock_dataset):
+    """
+    Test the to_netcdf function to ensure variables packed to integers
+    (scale_factor, no _FillValue) are exported and read back correctly.
+    """
+    ds = mock_dataset.copy()
+    ds['TEMP'].encoding = {'dtype': 'int16', 'scale_factor': 0.01}
+
+    with TemporaryDirectory() as tmpdir:
+        dataset.to_netcdf(ds, tmpdir, file_name='packed_test', verbose=False)
+
+        with xr.open_dataset(Path(tmpdir) / 'packed_test.nc') as ds_nc:
+            assert ds_nc['TEMP'].encoding['dtype'] == np.dtype('int16')
+            np.testing.assert_allclose(ds_nc['TEMP'].values,
+                                       mock_dataset['TEMP'].values,
+                                       atol=0.01)
+
+
+def test_to_netcdf_zarr(mock_dataset):
+    """
+    Test the to_netcdf function to ensure Zarr export works correctly.
+    """
+    pytest.importorskip('zarr')
+
+    with TemporaryDirectory() as tmpdir:
+        dataset.to_netcdf(mock_dataset, tmpdir, file_name='zarr_test',
+                          file_format='zarr', verbose=False)
+        store_path = Path(tmpdir) / 'zarr_test.zarr'
+        assert store_path.exists()
+
+        ds_zarr = xr.open_zarr(store_path)
+        np.testing.assert_array_equal(ds_zarr['TEMP'].values,
+                                      mock_dataset['TEMP'].values)
+        assert ds_zarr['TEMP'].encoding['chunks'] == (1, 5)
+        assert 'Creation of this zarr store' in ds_zarr.attrs['history']
+
+        # Variable packed to integers (scale_factor, no _FillValue)
+        ds_packed = mock_dataset.copy()
+        ds_packed['TEMP'].encoding = {'dtype': 'int16', 'scale_factor': 0.01}
+        dataset.to_netcdf(ds_packed, tmpdir, file_name='zarr_packed_test',
+                          file_format='zarr', verbose=False)
+        ds_zarr_packed = xr.open_zarr(Path(tmpdir) / 'zarr_packed_test.zarr')
+        assert ds_zarr_packed['TEMP'].encoding['dtype'] == np.dtype('int16')
+        np.testing.assert_allclose(ds_zarr_packed['TEMP'].values,
+                                   mock_dataset['TEMP'].values, atol=0.01)
+
+
+def test_to_netcdf_zarr_overwrite(mock_dataset):
+    """
+    Test the to_netcdf function to ensure an existing Zarr store is only
+    overwritten after confirmation.
+    """
+    pytest.importorskip('zarr')
+
+    with TemporaryDirectory() as tmpdir:
+        store_path = Path(tmpdir) / 'zarr_test.zarr'
+        dataset.to_netcdf(mock_dataset, tmpdir, file_name='zarr_test',
+                          file_format='zarr', verbose=False)
+
+        # Decline -> store is left as it is
+        ds_new = mock_dataset.copy()
+        ds_new['TEMP'] = ds_new['TEMP'] + 100
+        with patch('builtins.input', return_value='n'):
+            dataset.to_netcdf(ds_new, tmpdir, file_name='zarr_test',
+                              file_format='zarr', verbose=False)
+        np.testing.assert_array_equal(xr.open_zarr(store_path)['TEMP'].values,
+                                      mock_dataset['TEMP'].values)
+
+        # Accept -> store is replaced
+        with patch('builtins.input', return_value='y'):
+            dataset.to_netcdf(ds_new, tmpdir, file_name='zarr_test',
+                              file_format='zarr', verbose=False)
+        np.testing.assert_array_equal(xr.open_zarr(store_path)['TEMP'].values,
+                                      ds_new['TEMP'].values)
+
+
+def test_to_netcdf_invalid_file_format(mock_dataset):
+    """
+    Test the to_netcdf function to ensure an invalid file_format is rejected.
+    """
+    with TemporaryDirectory() as tmpdir:
+        with pytest.raises(ValueError):
+            dataset.to_netcdf(mock_dataset, tmpdir, file_format='csv')
+
+
 # TEST METADATA EXPORT
 
 def test_metadata_to_txt(mock_dataset):
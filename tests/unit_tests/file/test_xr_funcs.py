@@ -1,42 +1,55 @@
 import pytest
 import xarray as xr
-import pandas as pd
 import numpy as np
+from pathlib import Path
 from kval.util import xr_funcs  # Assuming the function is in xr_funcs module
 
-# Define a fixture for a mock dataset
-@pytest.fixture
-def mock_dataset() -> xr.Dataset:
+# Ignore FutureWarnings issued by xarray itself (e.g. about upcoming changes
+# in indexing behaviour) - these are not about kval
+pytestmark = pytest.mark.filterwarnings("ignore::FutureWarning:xarray")
+
+# Data for the mock dataset
+_TIME = (np.datetime64('2024-01-01')
+         + np.arange(10, dtype='timedelta64[D]')).astype('datetime64[ns]')
+_PRES = np.array([100, 600, 2000, 6000, 11000], dtype=np.int32)  # Pressure levels
+_STATIONS = np.array([f'st{stnum:02d}' for stnum in range(1, 11)])
+_OCEANS = np.array(['Atlantic', 'Arctic', 'Pacific', 'Mediterranean',
+                    'Southern', 'Baltic', 'Indian', 'Caribbean', 'Weddell',
+                    'Ross'])
+_ZONES = np.array(['epipelagic', 'mesopelagic', 'bathypelagic',
+                   'abyssopelagic', 'hadopelagic'])
+
+# Define fixtures for a mock dataset
+# (Built once per module - the tests below do not modify the dataset)
+@pytest.fixture(scope="module")
+def mock_dataset_file(tmp_path_factory) -> Path:
     """
-    Fixture to create a mock xarray.Dataset with metadata and variables for testing.
+    Fixture to create a mock dataset with metadata and variables for testing,
+    and write it to a temporary NetCDF file.
     """
-    # Define dimensions
-    Nt = 10
-    time = pd.date_range('2024-01-01', periods=Nt, freq='D')
-    pres = [100, 600, 2000, 6000, 11000]  # Pressure levels
+    rng = np.random.default_rng(0)  # Deterministic TEMP data
 
     # Create data for TEMP(TIME, PRES)
-    temp_data = 15 + 8 * np.random.randn(Nt, len(pres))  # Example temperature data
-
-    # Create data for STATION(TIME) and OCEAN(TIME)
-    station_data = [f'st{stnum:02.0f}' for stnum in np.arange(1, Nt + 1)]
-    ocean_data = ['Atlantic', 'Arctic', 'Pacific', 'Mediterranean', 'Southern', 
-                 'Baltic', 'Indian', 'Caribbean', 'Weddell', 'Ross']
+    # (Example temperature data as a C-ordered float32 array, so that
+    # selecting along TIME slices whole rows)
+    temp_data = np.ascontiguousarray(
+        15 + 8 * rng.standard_normal((len(_TIME), len(_PRES)),
+                                     dtype=np.float32))
 
-    # Create data for ZONE(PRES)
-    zone_data = ['epipelagic', 'mesopelagic', 'bathypelagic', 'abyssopelagic', 'hadopelagic']
-
-    # Create the Dataset
+    # Create the Dataset (from ready-made xr.Variable objects)
     ds = xr.Dataset(
         {
-            'TEMP': (['TIME', 'PRES'], temp_data),
-            'OCEAN': (['TIME'], ocean_data),
-            'STATION': (['TIME'], station_data),
-            'ZONE': (['PRES'], zone_data)
+            'TEMP': xr.Variable(('TIME', 'PRES'), temp_data, attrs={
+                'units': 'degC',
+                'long_name': 'Test Temperature'
+            }),
+            'OCEAN': xr.Variable(('TIME',), _OCEANS),
+            'STATION': xr.Variable(('TIME',), _STATIONS),
+            'ZONE': xr.Variable(('PRES',), _ZONES)
         },
         coords={
-            'TIME': time,
-            'PRES': pres
+            'TIME': _TIME,
+            'PRES': _PRES
         },
         # Add some metadata
         attrs={
@@ -46,54 +59,127 @@ def mock_dataset() -> xr.Dataset:
         }
     )
 
-    # Add variable attributes
-    ds['TEMP'].attrs = {
-        'units': 'degC',
-        'long_name': 'Test Temperature'
-    }
-    
-    return ds
+    file_path = tmp_path_factory.mktemp('data') / 'mock_dataset.nc'
+    ds.to_netcdf(file_path)
+
+    return file_path
+
+
+@pytest.fixture(scope="module")
+def mock_dataset(mock_dataset_file) -> xr.Dataset:
+    """
+    Fixture to load the mock xarray.Dataset (eagerly) from file.
+    """
+    return xr.load_dataset(mock_dataset_file)
+
+
+@pytest.fixture(scope="module")
+def mock_dataset_time(mock_dataset) -> xr.Dataset:
+    """
+    Lighter version of the mock dataset: only TEMP and the TIME variables
+    (STATION, OCEAN).
+    """
+    return mock_dataset.drop_vars('ZONE')
+
+
+@pytest.fixture(scope="module")
+def mock_dataset_pres(mock_dataset) -> xr.Dataset:
+    """
+    Lighter version of the mock dataset: only TEMP and the PRES variable
+    (ZONE).
+    """
+    return mock_dataset.drop_vars(['STATION', 'OCEAN'])
+
+
+@pytest.fixture(scope="module")
+def mock_dataset_coords(mock_dataset) -> xr.Dataset:
+    """
+    Version of the mock dataset where STATION and ZONE are (non-dimension)
+    coordinates rather than data variables.
+    """
+    return mock_dataset.set_coords(['STATION', 'ZONE'])
+
+
+@pytest.fixture(scope="module")
+def picked():
+    """
+    Fixture returning a memoized version of xr_funcs.pick(), so that
+    identical calls (same dataset and conditions) are only evaluated once.
+    (Safe since the tests do not modify the results).
+    """
+    cache = {}
+
+    def _pick(ds, **kwargs):
+        key = (id(ds),) + tuple(sorted(
+            (name, tuple(value) if isinstance(value, list) else value)
+            for name, value in kwargs.items()))
+        if key not in cache:
+            cache[key] = xr_funcs.pick(ds, **kwargs)
+        return cache[key]
+
+    return _pick
 
     
 ### Testing the pick() function
 
-def test_pick_single_TIME(mock_dataset):
-    result = xr_funcs.pick(mock_dataset, STATION='st02')
-    assert list(result.dims) == ['PRES']
-    assert 'st02' in result.STATION.values
-    assert 'Arctic' in result.OCEAN.values
-
-def test_pick_multiple_TIME(mock_dataset):
-    result = xr_funcs.pick(mock_dataset, STATION=['st02', 'st03'])
-    assert result.sizes['TIME'] == 2
-    assert 'st02' in result.STATION.values
-    assert 'st03' in result.STATION.values
-
-def test_pick_single_PRES(mock_dataset):
-    result = xr_funcs.pick(mock_dataset, ZONE='epipelagic')
-    assert list(result.dims) == ['TIME']
-    assert 'epipelagic' in result.ZONE.values
-    assert result.PRES.item() == 100
-
-def test_pick_multiple_PRES(mock_dataset):
-    result = xr_funcs.pick(mock_dataset, ZONE=['epipelagic', 'hadopelagic'])
-    assert result.sizes['PRES'] == 2
-    assert 'epipelagic' in result.ZONE.values
-    assert 'hadopelagic' in result.ZONE.values
-
-def test_pick_nonexistent_value(mock_dataset):
-    result = xr_funcs.pick(mock_dataset, STATION='st11')
-    assert list(result.dims) == ['TIME', 'PRES']
-    assert result.sizes['TIME'] == 0
-
-def test_pick_squeeze_false(mock_dataset):
-    result = xr_funcs.pick(mock_dataset, STATION='st02', squeeze=False)
-    assert result.sizes['TIME'] == 1
-    assert result.sizes['PRES'] == 5  # PRES dimension should remain unchanged
-
-def test_pick_with_squeeze(mock_dataset):
-    result = xr_funcs.pick(mock_dataset, STATION='st02')
-    assert 'TIME' not in result.dims
+# Cases for test_pick():
+# (name of the dataset fixture, pick() keyword arguments, expected dims
+#  (None: don't check), expected dimension sizes, (variable, value) pairs
+#  expected in the result)
+PICK_CASES = [
+    pytest.param(
+        'mock_dataset_time', dict(STATION='st02'), ('PRES',), {},
+        [('STATION', 'st02'), ('OCEAN', 'Arctic')],
+        id='single_TIME'),
+    pytest.param(
+        'mock_dataset_time', dict(STATION=['st02', 'st03']), None,
+        {'TIME': 2}, [('STATION', 'st02'), ('STATION', 'st03')],
+        id='multiple_TIME'),
+    pytest.param(
+        'mock_dataset_pres', dict(ZONE='epipelagic'), ('TIME',), {},
+        [('ZONE', 'epipelagic'), ('PRES', 100)],
+        id='single_PRES'),
+    pytest.param(
+        'mock_dataset_pres', dict(ZONE=['epipelagic', 'hadopelagic']), None,
+        {'PRES': 2}, [('ZONE', 'epipelagic'), ('ZONE', 'hadopelagic')],
+        id='multiple_PRES'),
+    pytest.param(
+        'mock_dataset_time', dict(STATION='st11'), ('TIME', 'PRES'),
+        {'TIME': 0}, [],
+        id='nonexistent_value'),
+    pytest.param(
+        # PRES dimension should remain unchanged
+        'mock_dataset_time', dict(STATION='st02', squeeze=False), None,
+        {'TIME': 1, 'PRES': 5}, [],
+        id='squeeze_false'),
+    pytest.param(
+        'mock_dataset_time', dict(STATION='st02'), ('PRES',), {}, [],
+        id='with_squeeze'),
+    pytest.param(
+        'mock_dataset_coords', dict(STATION='st02'), ('PRES',), {},
+        [('STATION', 'st02'), ('OCEAN', 'Arctic')],
+        id='single_TIME_coord'),
+    pytest.param(
+        'mock_dataset_coords', dict(ZONE=['epipelagic', 'hadopelagic']),
+        None, {'PRES': 2}, [('ZONE', 'epipelagic'), ('ZONE', 'hadopelagic')],
+        id='multiple_PRES_coord'),
+]
+
+
+@pytest.mark.parametrize('dataset, kwargs, dims, sizes, checks', PICK_CASES)
+def test_pick(request, picked, dataset, kwargs, dims, sizes, checks):
+    ds = request.getfixturevalue(dataset)
+    result = picked(ds, **kwargs)
+    if dims is not None:
+        assert tuple(result.sizes) == dims
+    for dim, size in sizes.items():
+        assert result.sizes[dim] == size
+    for varnm, value in checks:
+        data = result[varnm].data
+        if data.ndim == 0:  # Squeezed to a scalar
+            assert data[()] == value
+        else:
+            assert value in frozenset(data.tolist())
 
 def test_pick_invalid_dimension(mock_dataset):
     with pytest.raises(ValueError):
@@ -101,32 +187,15 @@ def test_pick_invalid_dimension(mock_dataset):
 
 def test_pick_multiple_conditions(mock_dataset):
     # Use multiple conditions: both STATION and ZONE
-    result = xr_funcs.pick(mock_dataset, 
-                           STATION=['st02', 'st03', 'st05'], 
+    result = xr_funcs.pick(mock_dataset,
+                           STATION=['st02', 'st03', 'st05'],
                            ZONE=['epipelagic', 'bathypelagic'])
     
-    # Check that only the entries that match both conditions are present
-    assert result.sizes['TIME'] == 3  # Only one TIME index should match the condition
-    assert result.sizes['PRES'] == 2  # Only one PRES index should match the condition
-    
-    # Verify the results
-    assert 'epipelagic' in result.ZONE.values
-    assert 'bathypelagic' in result.ZONE.values
-    assert 'st02' in result.STATION.values
-    assert 'st03' in result.STATION.values
-    assert 'st05' in result.STATION.values
-    assert 'st01' not in result.STATION.values    
-    assert 'abyssopelagic' not in result.ZONE.values
-    
-    # Check if `TIME` dimension is correctly filtered
-    assert len(result.TIME) == 3
-    assert pd.Timestamp('2024-01-02') in result.TIME
-    assert pd.Timestamp('2024-01-03') in result.TIME
-    assert pd.Timestamp('2024-01-05') in result.TIME
-    assert pd.Timestamp('2024-01-04') not in result.TIME
-
-    # Check if `PRES` dimension is correctly filtered
-    assert (result.PRES.values == [100, 2000]).all()
+    # Only the entries that match both conditions should be present:
+    # st02, st03, st05 (TIME indices 1, 2, 4) and
+    # epipelagic, bathypelagic (PRES indices 0, 2)
+    expected = mock_dataset.isel(TIME=[1, 2, 4], PRES=[0, 2])
+    xr.testing.assert_equal(result, expected)
 
 
 ### Testing the swap_var_coord() function
@@ -138,7 +207,7 @@ def test_swap_var_coord_basic(mock_dataset):
     # Check that STATION is now a coordinate and TIME is a variable
     assert 'STATION' in result.coords
     assert 'TIME' in result.variables and 'TIME' not in result.coords
-    assert list(result.dims) == ['STATION', 'PRES']
+    assert tuple(result.sizes) == ('STATION', 'PRES')
 
 def test_swap_var_coord_with_drop(mock_dataset):
     # Test swapping with dropping the original coordinate
@@ -147,7 +216,7 @@ def test_swap_var_coord_with_drop(mock_dataset):
     # Check that STATION is now a coordinate and TIME is completely removed
     assert 'STATION' in result.coords
     assert 'TIME' not in result.variables
-    assert list(result.dims) == ['STATION', 'PRES']
+    assert tuple(result.sizes) == ('STATION', 'PRES')
 
 def test_swap_var_coord_invalid_coordinate(mock_dataset):
     # Test with an invalid coordinate name
@@ -166,7 +235,7 @@ def test_swap_var_coord_no_drop(mock_dataset):
     # Check that ZONE is now a coordinate and PRES is still in the dataset
     assert 'ZONE' in result.coords
     assert 'PRES' in result.variables and 'PRES' not in result.coords
-    assert list(result.dims) == ['TIME', 'ZONE']
+    assert tuple(result.sizes) == ('TIME', 'ZONE')
 
 def test_swap_var_coord_preserve_data(mock_dataset):
     # Test that data is preserved correctly after swapping
@@ -183,7 +252,7 @@ def test_swap_var_coord_restore(mock_dataset):
     result = xr_funcs.swap_var_coord(result, coordinate='STATION', variable='TIME')
     
     # Check that the restored dataset matches the original dimensions and coordinates
-    assert list(result.dims) == ['TIME', 'PRES']
+    assert tuple(result.sizes) == ('TIME', 'PRES')
     assert 'TIME' in result.coords
     assert 'STATION' in result.variables and 'STATION' not in result.coords
     assert mock_dataset.equals(result)
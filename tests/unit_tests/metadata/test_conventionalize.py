@@ -0,0 +1,35 @@
+import xarray as xr
+import numpy as np
+from kval.metadata import conventionalize
+
+
+def make_dataset() -> xr.Dataset:
+    ds = xr.Dataset(
+        {'TEMP': (['TIME'], np.arange(3.0),
+                  {'units': 'degC', 'long_name': 'Temperature'})},
+        coords={'TIME': np.arange(3)},
+        attrs={'summary': 'A summary', 'title': 'A title',
+               'processing_level': 'Data manually reviewed',
+               'data_set_language': 'eng', 'extra_attr': 'something'})
+    return ds
+
+
+def test_reorder_list_no_duplicates():
+    # Attributes listed more than once in the reference order should
+    # only appear once after reordering
+    reordered = conventionalize._reorder_list(
+        ['summary', 'extra_attr', 'title'], ['title', 'summary', 'title'])
+    assert reordered == ['title', 'summary', 'extra_attr']
+
+
+def test_reorder_attrs_second_call_leaves_attrs_untouched():
+    ds = conventionalize.reorder_attrs(make_dataset())
+    attrs_before = ds.attrs
+    attrs_list_before = list(ds.attrs.items())
+
+    # The global attributes should not be reassigned on a second call
+    # (reassigning would replace the attrs dict with a new one)
+    ds = conventionalize.reorder_attrs(ds)
+
+    assert ds.attrs is attrs_before
+    assert list(ds.attrs.items()) == attrs_list_before